@@ -0,0 +1,15 @@
+from .exceptions import DuplicateFacilityError, SourceError, StaticDataError
+from .loader import SOURCES_DIR, iter_source_paths, load_source
+from .models import Facility
+from .registry import Registry
+
+__all__ = [
+    'SOURCES_DIR',
+    'DuplicateFacilityError',
+    'Facility',
+    'Registry',
+    'SourceError',
+    'StaticDataError',
+    'iter_source_paths',
+    'load_source',
+]
@@ -0,0 +1,26 @@
+import argparse
+from pathlib import Path
+
+from .bundle import write_bundle
+from .loader import SOURCES_DIR
+from .registry import Registry
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m parkapi_static_data')
+    parser.add_argument('--sources', type=Path, default=SOURCES_DIR, help='directory containing the source files')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    bundle_parser = commands.add_parser('bundle', help='compile all sources into a binary bundle')
+    bundle_parser.add_argument('output', type=Path)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'bundle':
+        registry = Registry.from_directory(args.sources)
+        write_bundle(registry, args.output)
+        print(f'wrote {len(registry)} facilities to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
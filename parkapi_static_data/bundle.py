@@ -0,0 +1,219 @@
+"""
+Compiled binary bundle of all sources.
+
+Layout (little endian, every section 8-byte aligned)::
+
+    header   magic 'PKSD', version u16, reserved u16, facility count u32, section count u32
+    sections section count * (name 32s, typecode 1s, offset u64, length u64)
+    data     one fixed-width column per property, plus the string table
+
+String properties are stored as u32 indexes into the string table, ``STRING_NULL`` meaning absent.
+Integer properties use ``INTEGER_NULL`` and booleans ``-1`` for absent values. Properties which are
+not part of the schema are kept as a JSON object in the ``extra`` column.
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from typing import Any
+
+from .exceptions import SourceError
+from .models import Facility
+from .registry import Registry
+from .schema import BOOLEAN_PROPERTIES, INTEGER_PROPERTIES, KNOWN_PROPERTIES, STRING_PROPERTIES
+
+BUNDLE_MAGIC = b'PKSD'
+BUNDLE_VERSION = 1
+
+STRING_NULL = 0xFFFFFFFF
+INTEGER_NULL = -(2**31)
+BOOLEAN_NULL = -1
+
+_HEADER = struct.Struct('<4sHHII')
+_SECTION = struct.Struct('<32scQQ')
+
+SOURCE_COLUMN = 'source'
+EXTRA_COLUMN = 'extra'
+LONGITUDE_COLUMN = 'longitude'
+LATITUDE_COLUMN = 'latitude'
+STRING_OFFSETS_SECTION = 'string_offsets'
+STRING_DATA_SECTION = 'string_data'
+
+
+class StringTableBuilder:
+    def __init__(self):
+        self.indexes: dict[str, int] = {}
+        self.offsets = array('I', [0])
+        self.data = bytearray()
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return STRING_NULL
+        index = self.indexes.get(value)
+        if index is None:
+            index = len(self.indexes)
+            self.indexes[value] = index
+            self.data += value.encode('utf-8')
+            self.offsets.append(len(self.data))
+        return index
+
+
+def encode_bundle(registry: Registry) -> bytes:
+    strings = StringTableBuilder()
+    columns: dict[str, array] = {SOURCE_COLUMN: array('I'), EXTRA_COLUMN: array('I')}
+    for name in STRING_PROPERTIES:
+        columns[name] = array('I')
+    for name in INTEGER_PROPERTIES:
+        columns[name] = array('i')
+    for name in BOOLEAN_PROPERTIES:
+        columns[name] = array('b')
+    columns[LONGITUDE_COLUMN] = array('d')
+    columns[LATITUDE_COLUMN] = array('d')
+
+    for facility in registry:
+        properties = facility.properties
+        columns[SOURCE_COLUMN].append(strings.add(facility.source_uid))
+        for name in STRING_PROPERTIES:
+            value = properties.get(name)
+            columns[name].append(strings.add(None if value is None else str(value)))
+        for name in INTEGER_PROPERTIES:
+            value = properties.get(name)
+            columns[name].append(INTEGER_NULL if value is None else int(value))
+        for name in BOOLEAN_PROPERTIES:
+            value = properties.get(name)
+            columns[name].append(BOOLEAN_NULL if value is None else int(bool(value)))
+        columns[LONGITUDE_COLUMN].append(facility.longitude)
+        columns[LATITUDE_COLUMN].append(facility.latitude)
+        extra = {key: value for key, value in properties.items() if key not in KNOWN_PROPERTIES}
+        columns[EXTRA_COLUMN].append(strings.add(json.dumps(extra, ensure_ascii=False)) if extra else STRING_NULL)
+
+    sections: list[tuple[str, str, bytes]] = [(name, column.typecode, column.tobytes()) for name, column in columns.items()]
+    sections.append((STRING_OFFSETS_SECTION, 'I', strings.offsets.tobytes()))
+    sections.append((STRING_DATA_SECTION, 'B', bytes(strings.data)))
+
+    offset = _align(_HEADER.size + _SECTION.size * len(sections))
+    table = bytearray()
+    body = bytearray()
+    for name, typecode, data in sections:
+        table += _SECTION.pack(name.encode('ascii'), typecode.encode('ascii'), offset + len(body), len(data))
+        body += data
+        body += b'\0' * (_align(len(body)) - len(body))
+
+    header = _HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(registry), len(sections)) + table
+    header += b'\0' * (offset - len(header))
+    return bytes(header + body)
+
+
+def write_bundle(registry: Registry, path: Path) -> None:
+    data = encode_bundle(registry)
+    path = Path(path)
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+class Bundle:
+    """
+    Read-only view on a compiled bundle.
+
+    Columns are ``memoryview`` objects on the underlying buffer, so opening a bundle does not decode any
+    data. Strings are decoded lazily on first access.
+    """
+
+    def __init__(self, buffer: Any):
+        self._buffer = memoryview(buffer).toreadonly()
+        magic, version, _, count, section_count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != BUNDLE_MAGIC:
+            raise SourceError('not a static data bundle')
+        if version != BUNDLE_VERSION:
+            raise SourceError(f'unsupported bundle version {version}, expected {BUNDLE_VERSION}')
+        self.count: int = count
+        self.columns: dict[str, memoryview] = {}
+        for i in range(section_count):
+            name, typecode, offset, length = _SECTION.unpack_from(self._buffer, _HEADER.size + i * _SECTION.size)
+            section = self._buffer[offset : offset + length]
+            self.columns[name.rstrip(b'\0').decode('ascii')] = section.cast(typecode.decode('ascii'))
+        self._string_offsets = self.columns.pop(STRING_OFFSETS_SECTION)
+        self._string_data = self.columns.pop(STRING_DATA_SECTION)
+        self._strings: list[str | None] = [None] * (len(self._string_offsets) - 1)
+        self._slots: dict[tuple[str, str], int] | None = None
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def open(cls, path: Path) -> 'Bundle':
+        with Path(path).open('rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        bundle = cls(mapped)
+        bundle._mmap = mapped
+        return bundle
+
+    def close(self) -> None:
+        for column in self.columns.values():
+            column.release()
+        self._string_offsets.release()
+        self._string_data.release()
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'Bundle':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def string(self, index: int) -> str | None:
+        if index == STRING_NULL:
+            return None
+        value = self._strings[index]
+        if value is None:
+            start, end = self._string_offsets[index], self._string_offsets[index + 1]
+            value = bytes(self._string_data[start:end]).decode('utf-8')
+            self._strings[index] = value
+        return value
+
+    def value(self, slot: int, name: str) -> Any:
+        raw = self.columns[name][slot]
+        if name in STRING_PROPERTIES or name in (SOURCE_COLUMN, EXTRA_COLUMN):
+            return self.string(raw)
+        if name in INTEGER_PROPERTIES:
+            return None if raw == INTEGER_NULL else raw
+        if name in BOOLEAN_PROPERTIES:
+            return None if raw == BOOLEAN_NULL else bool(raw)
+        return raw
+
+    def slot(self, source_uid: str, uid: str) -> int:
+        if self._slots is None:
+            sources, uids = self.columns[SOURCE_COLUMN], self.columns['uid']
+            self._slots = {(self.string(sources[i]), self.string(uids[i])): i for i in range(self.count)}
+        return self._slots[(source_uid, uid)]
+
+    def facility(self, slot: int) -> Facility:
+        properties: dict[str, Any] = {}
+        for name in STRING_PROPERTIES + INTEGER_PROPERTIES + BOOLEAN_PROPERTIES:
+            value = self.value(slot, name)
+            if value is not None:
+                properties[name] = value
+        extra = self.value(slot, EXTRA_COLUMN)
+        if extra is not None:
+            properties.update(json.loads(extra))
+        return Facility(
+            source_uid=self.value(slot, SOURCE_COLUMN),
+            uid=properties['uid'],
+            longitude=self.columns[LONGITUDE_COLUMN][slot],
+            latitude=self.columns[LATITUDE_COLUMN][slot],
+            properties=properties,
+        )
+
+    def to_registry(self) -> Registry:
+        return Registry(self.facility(slot) for slot in range(self.count))
+
+
+def _align(value: int, alignment: int = 8) -> int:
+    return (value + alignment - 1) // alignment * alignment
@@ -0,0 +1,10 @@
+class StaticDataError(Exception):
+    """Base class for all errors raised by this package."""
+
+
+class SourceError(StaticDataError):
+    """A source file could not be read or does not have the expected structure."""
+
+
+class DuplicateFacilityError(StaticDataError):
+    """Two features share the same ``(source_uid, uid)`` key."""
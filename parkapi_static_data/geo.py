@@ -0,0 +1,21 @@
+from math import asin, cos, radians, sin, sqrt
+
+EARTH_RADIUS = 6_371_008.8
+METERS_PER_DEGREE = radians(1) * EARTH_RADIUS
+
+BoundingBox = tuple[float, float, float, float]
+
+
+def haversine(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Great-circle distance in metres."""
+    phi1, phi2 = radians(lat1), radians(lat2)
+    a = sin((phi2 - phi1) / 2) ** 2 + cos(phi1) * cos(phi2) * sin(radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * asin(min(1.0, sqrt(a)))
+
+
+def bbox_around(lon: float, lat: float, radius: float) -> BoundingBox:
+    """Bounding box ``(min_lon, min_lat, max_lon, max_lat)`` containing the circle of ``radius`` metres."""
+    delta_lat = radius / METERS_PER_DEGREE
+    max_abs_lat = min(abs(lat) + delta_lat, 89.999)
+    delta_lon = min(radius / (METERS_PER_DEGREE * cos(radians(max_abs_lat))), 180.0)
+    return lon - delta_lon, lat - delta_lat, lon + delta_lon, lat + delta_lat
@@ -0,0 +1,53 @@
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .exceptions import SourceError
+from .models import Facility
+
+# sources/ of the repository checkout, installed packages point PARKAPI_STATIC_DATA_SOURCES at a copy of it
+SOURCES_DIR = Path(os.environ.get('PARKAPI_STATIC_DATA_SOURCES') or Path(__file__).resolve().parent.parent / 'sources')
+SOURCE_SUFFIX = '.geojson'
+
+
+def iter_source_paths(sources_dir: Path = SOURCES_DIR) -> Iterator[Path]:
+    """Yield all source files in a stable order."""
+    yield from sorted(Path(sources_dir).glob(f'*{SOURCE_SUFFIX}'))
+
+
+def source_uid_for_path(path: Path) -> str:
+    return Path(path).stem
+
+
+def facility_from_feature(source_uid: str, feature: dict[str, Any]) -> Facility:
+    properties = feature.get('properties') or {}
+    geometry = feature.get('geometry') or {}
+    if 'uid' not in properties:
+        raise SourceError(f'{source_uid}: feature without uid')
+    if geometry.get('type') != 'Point':
+        raise SourceError(f'{source_uid}/{properties["uid"]}: geometry is not a Point')
+    longitude, latitude = geometry['coordinates'][:2]
+    return Facility(
+        source_uid=source_uid,
+        uid=str(properties['uid']),
+        longitude=float(longitude),
+        latitude=float(latitude),
+        properties=properties,
+    )
+
+
+def load_source(path: Path, source_uid: str | None = None) -> list[Facility]:
+    """Parse one GeoJSON source file into facilities."""
+    path = Path(path)
+    if source_uid is None:
+        source_uid = source_uid_for_path(path)
+    try:
+        with path.open(encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError) as e:
+        raise SourceError(f'{path}: {e}') from e
+    if data.get('type') != 'FeatureCollection':
+        raise SourceError(f'{path}: not a FeatureCollection')
+    return [facility_from_feature(source_uid, feature) for feature in data.get('features', [])]
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class Facility:
+    """A single parking facility taken from a feature in ``sources/``."""
+
+    source_uid: str
+    uid: str
+    longitude: float
+    latitude: float
+    properties: dict[str, Any] = field(default_factory=dict, compare=False)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.source_uid, self.uid
+
+    @property
+    def name(self) -> str | None:
+        return self.properties.get('name')
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.properties.get(name, default)
+
+    def to_feature(self) -> dict[str, Any]:
+        return {
+            'type': 'Feature',
+            'properties': dict(self.properties),
+            'geometry': {'type': 'Point', 'coordinates': [self.longitude, self.latitude]},
+        }
@@ -0,0 +1,68 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .exceptions import DuplicateFacilityError
+from .loader import SOURCES_DIR, iter_source_paths, load_source
+from .models import Facility
+
+
+class Registry:
+    """
+    All facilities of all sources, loaded once.
+
+    Every facility gets a dense slot number (its position in ``facilities``), and lookups by
+    ``(source_uid, uid)`` are a single dict access.
+    """
+
+    def __init__(self, facilities: Iterable[Facility]):
+        self.facilities: list[Facility] = list(facilities)
+        self._slots: dict[tuple[str, str], int] = {}
+        self._source_slots: dict[str, list[int]] = {}
+        for slot, facility in enumerate(self.facilities):
+            if facility.key in self._slots:
+                raise DuplicateFacilityError(f'duplicate facility {facility.source_uid}/{facility.uid}')
+            self._slots[facility.key] = slot
+            self._source_slots.setdefault(facility.source_uid, []).append(slot)
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[Path]) -> 'Registry':
+        facilities: list[Facility] = []
+        for path in paths:
+            facilities.extend(load_source(path))
+        return cls(facilities)
+
+    @classmethod
+    def from_directory(cls, sources_dir: Path = SOURCES_DIR) -> 'Registry':
+        return cls.from_paths(iter_source_paths(sources_dir))
+
+    def __len__(self) -> int:
+        return len(self.facilities)
+
+    def __iter__(self) -> Iterator[Facility]:
+        return iter(self.facilities)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._slots
+
+    def __getitem__(self, key: tuple[str, str]) -> Facility:
+        return self.facilities[self._slots[key]]
+
+    @property
+    def source_uids(self) -> list[str]:
+        return list(self._source_slots)
+
+    def slot(self, source_uid: str, uid: str) -> int:
+        """Return the slot of a facility, raising ``KeyError`` if it is unknown."""
+        return self._slots[(source_uid, uid)]
+
+    def get(self, source_uid: str, uid: str, default: Facility | None = None) -> Facility | None:
+        slot = self._slots.get((source_uid, uid))
+        if slot is None:
+            return default
+        return self.facilities[slot]
+
+    def source_slots(self, source_uid: str) -> list[int]:
+        return self._source_slots.get(source_uid, [])
+
+    def by_source(self, source_uid: str) -> list[Facility]:
+        return [self.facilities[slot] for slot in self.source_slots(source_uid)]
@@ -0,0 +1,23 @@
+"""Known feature properties and their value types."""
+
+STRING_PROPERTIES: tuple[str, ...] = (
+    'uid',
+    'name',
+    'type',
+    'operator_name',
+    'public_url',
+    'address',
+    'description',
+)
+INTEGER_PROPERTIES: tuple[str, ...] = (
+    'capacity',
+    'capacity_disabled',
+    'capacity_women',
+    'capacity_woman',
+    'capacity_family',
+    'capacity_charging',
+    'max_height',
+)
+BOOLEAN_PROPERTIES: tuple[str, ...] = ('has_realtime_data',)
+
+KNOWN_PROPERTIES: frozenset[str] = frozenset(STRING_PROPERTIES + INTEGER_PROPERTIES + BOOLEAN_PROPERTIES)
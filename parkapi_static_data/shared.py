@@ -0,0 +1,67 @@
+"""
+Publish a compiled bundle into shared memory, so that all workers of a pool share one copy.
+
+The publishing process (e.g. the gunicorn master before forking, or a small init script) calls
+``SharedRegistry.publish()``, workers call ``SharedRegistry.attach()`` with the segment name.
+"""
+
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from .bundle import Bundle, encode_bundle
+from .registry import Registry
+
+DEFAULT_SEGMENT_NAME = 'parkapi_static_data'
+
+
+class SharedRegistry:
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool):
+        self.segment = segment
+        self.owner = owner
+        self.bundle = Bundle(segment.buf)
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    @classmethod
+    def publish(cls, registry: Registry, name: str | None = DEFAULT_SEGMENT_NAME) -> 'SharedRegistry':
+        data = encode_bundle(registry)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        segment.buf[: len(data)] = data
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name: str = DEFAULT_SEGMENT_NAME) -> 'SharedRegistry':
+        if sys.version_info >= (3, 13):
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            segment = _attach_untracked(name)
+        return cls(segment, owner=False)
+
+    def close(self) -> None:
+        self.bundle.close()
+        self.segment.close()
+
+    def unlink(self) -> None:
+        """Remove the segment. Only the publishing process should call this, after all workers are gone."""
+        self.segment.unlink()
+
+    def __enter__(self) -> 'SharedRegistry':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    # Before Python 3.13, attaching registers the segment with the resource tracker, which would unlink it
+    # as soon as the attaching worker exits.
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
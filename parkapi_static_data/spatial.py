@@ -0,0 +1,117 @@
+import heapq
+from collections.abc import Sequence
+from math import cos, floor, radians
+
+from .geo import METERS_PER_DEGREE, bbox_around, haversine
+from .registry import Registry
+
+DEFAULT_CELL_SIZE = 0.01
+
+
+class SpatialIndex:
+    """
+    Uniform grid over facility coordinates.
+
+    Cells are ``cell_size`` degrees wide and high and hold the slots of their facilities. Radius and
+    nearest-neighbour queries only look at the cells around the query point, so their cost depends on
+    local density rather than on the total number of facilities.
+    """
+
+    def __init__(self, longitudes: Sequence[float], latitudes: Sequence[float], cell_size: float = DEFAULT_CELL_SIZE):
+        self.longitudes = longitudes
+        self.latitudes = latitudes
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        for slot, (lon, lat) in enumerate(zip(longitudes, latitudes)):
+            self.cells.setdefault(self._cell(lon, lat), []).append(slot)
+        if self.cells:
+            self._min_x = min(x for x, _ in self.cells)
+            self._max_x = max(x for x, _ in self.cells)
+            self._min_y = min(y for _, y in self.cells)
+            self._max_y = max(y for _, y in self.cells)
+
+    @classmethod
+    def from_registry(cls, registry: Registry, cell_size: float = DEFAULT_CELL_SIZE) -> 'SpatialIndex':
+        return cls(
+            [facility.longitude for facility in registry],
+            [facility.latitude for facility in registry],
+            cell_size=cell_size,
+        )
+
+    def __len__(self) -> int:
+        return len(self.longitudes)
+
+    def _cell(self, lon: float, lat: float) -> tuple[int, int]:
+        return floor(lon / self.cell_size), floor(lat / self.cell_size)
+
+    def within_bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> list[int]:
+        """Slots of all facilities inside the bounding box, in no particular order."""
+        if not self.cells:
+            return []
+        min_x, min_y = self._cell(min_lon, min_lat)
+        max_x, max_y = self._cell(max_lon, max_lat)
+        min_x, max_x = max(min_x, self._min_x), min(max_x, self._max_x)
+        min_y, max_y = max(min_y, self._min_y), min(max_y, self._max_y)
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.cells):
+            cells = [slots for (x, y), slots in self.cells.items() if min_x <= x <= max_x and min_y <= y <= max_y]
+        else:
+            cells = [self.cells[(x, y)] for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1) if (x, y) in self.cells]
+        lons, lats = self.longitudes, self.latitudes
+        return [
+            slot
+            for slots in cells
+            for slot in slots
+            if min_lon <= lons[slot] <= max_lon and min_lat <= lats[slot] <= max_lat
+        ]
+
+    def within_radius(self, lon: float, lat: float, radius: float) -> list[tuple[int, float]]:
+        """``(slot, distance)`` of all facilities within ``radius`` metres, nearest first."""
+        result = []
+        for slot in self.within_bbox(*bbox_around(lon, lat, radius)):
+            distance = haversine(lon, lat, self.longitudes[slot], self.latitudes[slot])
+            if distance <= radius:
+                result.append((slot, distance))
+        result.sort(key=lambda item: item[1])
+        return result
+
+    def nearest(self, lon: float, lat: float, k: int = 1, max_distance: float | None = None) -> list[tuple[int, float]]:
+        """``(slot, distance)`` of the ``k`` nearest facilities, nearest first."""
+        if not self.cells or k <= 0:
+            return []
+        center_x, center_y = self._cell(lon, lat)
+        max_ring = max(
+            abs(center_x - self._min_x), abs(center_x - self._max_x), abs(center_y - self._min_y), abs(center_y - self._max_y)
+        )
+        # max-heap of the best k candidates as (-distance, slot)
+        best: list[tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            for cell in _ring_cells(center_x, center_y, ring):
+                for slot in self.cells.get(cell, ()):
+                    distance = haversine(lon, lat, self.longitudes[slot], self.latitudes[slot])
+                    if max_distance is not None and distance > max_distance:
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, slot))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, slot))
+            # Everything outside the rings visited so far is at least this far away.
+            lon_factor = cos(radians(min(abs(lat) + (ring + 1) * self.cell_size, 89.999)))
+            min_outside = ring * self.cell_size * METERS_PER_DEGREE * lon_factor
+            if len(best) == k and -best[0][0] <= min_outside:
+                break
+            if max_distance is not None and min_outside > max_distance:
+                break
+        return sorted(((slot, -distance) for distance, slot in best), key=lambda item: item[1])
+
+
+def _ring_cells(center_x: int, center_y: int, ring: int) -> list[tuple[int, int]]:
+    if ring == 0:
+        return [(center_x, center_y)]
+    cells = []
+    for x in range(center_x - ring, center_x + ring + 1):
+        cells.append((x, center_y - ring))
+        cells.append((x, center_y + ring))
+    for y in range(center_y - ring + 1, center_y + ring):
+        cells.append((center_x - ring, y))
+        cells.append((center_x + ring, y))
+    return cells
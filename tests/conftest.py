@@ -0,0 +1,17 @@
+import pytest
+
+from parkapi_static_data import Facility, Registry
+
+
+@pytest.fixture(scope='session')
+def registry() -> Registry:
+    return Registry.from_directory()
+
+
+@pytest.fixture
+def small_registry() -> Registry:
+    return Registry([
+        Facility('a', '1', 7.85, 47.99, {'uid': '1', 'name': 'Parkhaus Mühlwiesenstr.', 'type': 'CAR_PARK', 'capacity': 300}),
+        Facility('a', '2', 7.86, 47.98, {'uid': '2', 'name': 'Tiefgarage Süd', 'type': 'UNDERGROUND', 'capacity': 0}),
+        Facility('b', '1', 8.69, 49.41, {'uid': '1', 'name': 'P+R', 'has_realtime_data': True, 'custom': {'x': [1, 2]}}),
+    ])
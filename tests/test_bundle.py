@@ -0,0 +1,50 @@
+import uuid
+
+import pytest
+
+from parkapi_static_data import Registry
+from parkapi_static_data.bundle import BUNDLE_VERSION, Bundle, encode_bundle, write_bundle
+from parkapi_static_data.exceptions import SourceError
+from parkapi_static_data.shared import SharedRegistry
+
+
+def test_round_trip(registry, tmp_path):
+    path = tmp_path / 'static_data.bin'
+    write_bundle(registry, path)
+    with Bundle.open(path) as bundle:
+        assert len(bundle) == len(registry)
+        assert bundle.to_registry().facilities == registry.facilities
+        facility = registry.get('freiburg', '12')
+        slot = bundle.slot('freiburg', '12')
+        assert slot == registry.slot('freiburg', '12')
+        assert bundle.value(slot, 'capacity') == facility.get('capacity')
+        assert bundle.value(slot, 'longitude') == facility.longitude
+
+
+def test_null_and_extra_properties(small_registry):
+    bundle = Bundle(encode_bundle(small_registry))
+    assert bundle.to_registry().facilities == small_registry.facilities
+    assert bundle.value(2, 'capacity') is None
+    assert bundle.value(0, 'has_realtime_data') is None
+    assert bundle.value(2, 'has_realtime_data') is True
+
+
+def test_empty_registry():
+    assert len(Bundle(encode_bundle(Registry([]))).to_registry()) == 0
+
+
+def test_rejects_other_versions(small_registry):
+    data = bytearray(encode_bundle(small_registry))
+    data[4:6] = (BUNDLE_VERSION + 1).to_bytes(2, 'little')
+    with pytest.raises(SourceError):
+        Bundle(data)
+    with pytest.raises(SourceError):
+        Bundle(b'XXXX' + bytes(data[4:]))
+
+
+def test_shared_registry(small_registry):
+    name = f'parkapi_test_{uuid.uuid4().hex[:12]}'
+    with SharedRegistry.publish(small_registry, name=name) as published:
+        with SharedRegistry.attach(name) as attached:
+            assert attached.bundle.to_registry().facilities == small_registry.facilities
+        assert published.bundle.facility(1) == small_registry.facilities[1]
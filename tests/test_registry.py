@@ -0,0 +1,18 @@
+import pytest
+
+from parkapi_static_data import DuplicateFacilityError, Facility, Registry
+
+
+def test_lookups(registry):
+    facility = registry.get('freiburg', '12')
+    assert registry[('freiburg', '12')] is facility
+    assert registry.facilities[registry.slot('freiburg', '12')] is facility
+    assert ('freiburg', 'unknown') not in registry
+    assert sorted(registry.source_uids) == ['bietigheim_bissingen', 'freiburg', 'heidelberg', 'p_m_bw', 'ulm']
+    assert all(facility.source_uid == 'ulm' for facility in registry.by_source('ulm'))
+
+
+def test_duplicates():
+    facility = Facility('a', '1', 7.85, 47.99, {'uid': '1'})
+    with pytest.raises(DuplicateFacilityError):
+        Registry([facility, facility])
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from parkapi_static_data.geo import haversine
+from parkapi_static_data.spatial import SpatialIndex
+
+
+@pytest.fixture(scope='module')
+def points() -> tuple[list[float], list[float]]:
+    rng = random.Random(1)
+    return [rng.uniform(7, 9) for _ in range(3000)], [rng.uniform(47.5, 49) for _ in range(3000)]
+
+
+def _brute_force(points, lon, lat) -> list[tuple[float, int]]:
+    return sorted((haversine(lon, lat, x, y), slot) for slot, (x, y) in enumerate(zip(*points)))
+
+
+@pytest.mark.parametrize('lon, lat', [(8, 48), (7.0001, 47.5), (8.5, 48.5)])
+@pytest.mark.parametrize('k, max_distance', [(1, None), (7, None), (5, 3000), (3, 10)])
+def test_nearest(points, lon, lat, k, max_distance):
+    index = SpatialIndex(*points)
+    expected = [(slot, distance) for distance, slot in _brute_force(points, lon, lat) if max_distance is None or distance <= max_distance]
+    assert index.nearest(lon, lat, k, max_distance) == expected[:k]
+
+
+def test_within(points):
+    index = SpatialIndex(*points)
+    rng = random.Random(2)
+    for _ in range(50):
+        lon, lat = rng.uniform(6.5, 9.5), rng.uniform(47, 49.5)
+        bbox = (lon, lat, lon + rng.uniform(0, 1), lat + rng.uniform(0, 1))
+        expected = [slot for slot, (x, y) in enumerate(zip(*points)) if bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]]
+        assert sorted(index.within_bbox(*bbox)) == expected
+        assert index.estimate_bbox(*bbox) >= len(expected)
+        radius = rng.uniform(100, 20000)
+        expected_radius = [(slot, distance) for distance, slot in _brute_force(points, lon, lat) if distance <= radius]
+        assert index.within_radius(lon, lat, radius) == expected_radius
+
+
+def test_empty():
+    index = SpatialIndex([], [])
+    assert index.nearest(8, 48) == []
+    assert index.within_bbox(0, 0, 10, 10) == []
+    assert index.estimate_bbox(0, 0, 10, 10) == 0